@@ -1,27 +1,204 @@
-import requests
-from typing import List, Dict, Optional, Tuple
+import asyncio
+import hashlib
+import importlib.util
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, List, Dict, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:  # For annotations only; the real imports stay lazy
+    import aiohttp
+    import requests
+
+# HTTP clients are imported on first use; only check which ones are installed
+_HAS_AIOHTTP = importlib.util.find_spec('aiohttp') is not None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Parse with the standard library instead
+    _json_loads = json.loads
+
+
+# Only advertise brotli when a decoder is installed, otherwise the body is unreadable
+_HAS_BROTLI = any(importlib.util.find_spec(name) for name in ('brotli', 'brotlicffi'))
+_HEADERS = {
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate, br' if _HAS_BROTLI else 'gzip, deflate',
+}
+
+# Seconds allowed for each request, used by every fetch path
+_TIMEOUT = 15
+
+# Transient gateway and rate-limit errors are retried with exponential backoff
+_RETRY_STATUSES = (429, 502, 503, 504)
+_RETRIES = 3
+_BACKOFF = 0.3
+
+# Longest Retry-After we honour; anything longer would outlast the request timeout
+_MAX_RETRY_AFTER = 10.0
+
+# Shared session so repeated calls reuse pooled HTTPS connections
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> 'requests.Session':
+    """Return the shared requests session, creating it on first use."""
+    global _SESSION
+    
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            class CappedRetry(Retry):
+                """Retry that clamps Retry-After the same way the aiohttp path does."""
+                
+                def get_retry_after(self, response):
+                    retry_after = super().get_retry_after(response)
+                    if retry_after is None:
+                        return None
+                    return min(retry_after, _MAX_RETRY_AFTER)
+            
+            session = requests.Session()
+            session.headers.update(_HEADERS)
+            session.mount('https://', HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=8,
+                max_retries=CappedRetry(
+                    total=_RETRIES,
+                    backoff_factor=_BACKOFF,
+                    status_forcelist=_RETRY_STATUSES,
+                    allowed_methods=('GET',),
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+            ))
+            _SESSION = session
+    
+    return _SESSION
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retrying a request.
+    
+    Args:
+        attempt (int): Zero-based number of the attempt that failed
+        retry_after (str, optional): Retry-After header sent by the server
+    
+    Returns:
+        float: Delay honouring Retry-After, else exponential backoff with jitter
+    """
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), _MAX_RETRY_AFTER)
+    return _BACKOFF * 2 ** attempt + random.uniform(0, _BACKOFF)
+
+
+# Shared read-only stand-in for a missing address, so lookups allocate nothing
+_EMPTY = MappingProxyType({})
+
+# Pulls the flat JSONPlaceholder user fields in a single C-level call
+_USER_FIELDS = itemgetter('name', 'username', 'email')
+
+# Parsed responses are cached on disk for a few minutes between runs
+_CACHE_DIR = Path(tempfile.gettempdir()) / 'papi_cache'
+_CACHE_TTL = 180
+
+
+def _cache_path(url: str) -> Path:
+    """Return the cache file used for a URL."""
+    return _CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _cache_get(url: str, ttl: int) -> Tuple[object, Optional[str], bool]:
+    """
+    Load a cached parsed response for a URL.
+    
+    Expired entries are still returned so the caller can revalidate them with
+    a conditional GET instead of downloading the body again.
+    
+    Args:
+        url (str): Request URL the response was cached under
+        ttl (int): Maximum age of the cache entry in seconds
+    
+    Returns:
+        Tuple[object, Optional[str], bool]: The parsed JSON (None when missing or
+        unreadable), its ETag, and whether the entry is still within the TTL
+    """
+    path = _cache_path(url)
+    try:
+        age = time.time() - path.stat().st_mtime
+        entry = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None, None, False
+    
+    if not isinstance(entry, dict) or 'data' not in entry:
+        return None, None, False
+    return entry['data'], entry.get('etag'), age <= ttl
+
+
+def _cache_put(url: str, obj, etag: Optional[str] = None) -> None:
+    """Cache a parsed response and its ETag for a URL; failures only cost a refetch."""
+    path = _cache_path(url)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open('w', encoding='utf-8') as f:
+            json.dump({'etag': etag, 'data': obj}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _cache_touch(url: str) -> None:
+    """Restart the TTL of a cache entry the server confirmed is unchanged."""
+    try:
+        os.utime(_cache_path(url))
+    except OSError:
+        pass
+
+
+class ApiConfig(NamedTuple):
+    """Immutable configuration for one public API."""
+    url: str
+    name: str
+    fields: Tuple[str, ...]
 
 
 class PublicAPIFetcher:
     """A class to handle fetching and displaying data from various public APIs."""
     
+    __slots__ = ('api_type', 'api_config', 'data', '_display')
+    
     # Available API configurations
     APIS = {
-        'jsonplaceholder': {
-            'url': 'https://jsonplaceholder.typicode.com/users',
-            'name': 'JSONPlaceholder Users API',
-            'fields': ['name', 'username', 'email', 'city']
-        },
-        'randomuser': {
-            'url': 'https://randomuser.me/api/?results=10',
-            'name': 'Random User Generator API',
-            'fields': ['name', 'email', 'city', 'country']
-        },
-        'coingecko': {
-            'url': 'https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&order=market_cap_desc&per_page=10&page=1',
-            'name': 'CoinGecko Cryptocurrency API',
-            'fields': ['name', 'symbol', 'current_price', 'market_cap']
-        }
+        'jsonplaceholder': ApiConfig(
+            url='https://jsonplaceholder.typicode.com/users',
+            name='JSONPlaceholder Users API',
+            fields=('name', 'username', 'email', 'city')
+        ),
+        'randomuser': ApiConfig(
+            url='https://randomuser.me/api/?results=10',
+            name='Random User Generator API',
+            fields=('name', 'email', 'city', 'country')
+        ),
+        'coingecko': ApiConfig(
+            url='https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&order=market_cap_desc&per_page=10&page=1',
+            name='CoinGecko Cryptocurrency API',
+            fields=('name', 'symbol', 'current_price', 'market_cap')
+        )
     }
     
     def __init__(self, api_type: str = 'jsonplaceholder'):
@@ -37,146 +214,489 @@ class PublicAPIFetcher:
         self.api_type = api_type
         self.api_config = self.APIS[api_type]
         self.data: Optional[List[Dict]] = None
+        
+        # Bind the record formatter once instead of branching per record
+        self._display = {
+            'jsonplaceholder': self._display_user,
+            'randomuser': self._display_random_user,
+            'coingecko': self._display_crypto,
+        }[api_type]
     
-    def fetch_data(self) -> bool:
+    async def fetch_data(self, session: 'aiohttp.ClientSession') -> bool:
         """
         Fetch data from the selected API using GET method.
         
+        Args:
+            session (aiohttp.ClientSession): Shared session used to issue the request
+        
         Returns:
             bool: True if data was fetched successfully, False otherwise
         """
+        import aiohttp
+        
         try:
-            print(f"Fetching data from {self.api_config['name']}...")
-            print(f"URL: {self.api_config['url']}\n")
+            served, cached, headers = self._load_cached()
+            if served:
+                return True
             
-            response = requests.get(self.api_config['url'], timeout=15)
+            timeout = aiohttp.ClientTimeout(total=_TIMEOUT)
+            for attempt in range(_RETRIES + 1):
+                async with session.get(self.api_config.url, headers=headers, timeout=timeout) as response:
+                    if response.status == 304 and headers:
+                        self._use_cached(cached)
+                        return True
+                    
+                    if response.status not in _RETRY_STATUSES or attempt == _RETRIES:
+                        # Check if request was successful
+                        response.raise_for_status()
+                        
+                        # Parse JSON data
+                        json_data = _json_loads(await response.read())
+                        etag = response.headers.get('ETag')
+                        break
+                    
+                    delay = _retry_delay(attempt, response.headers.get('Retry-After'))
+                
+                # Back off outside the response block so the connection is released
+                await asyncio.sleep(delay)
+            
+            self._accept(json_data, etag)
+            return True
+            
+        except asyncio.TimeoutError:
+            print(f"✗ Error: Request to {self.api_config.name} timed out. Please check your internet connection.")
+            return False
+        
+        except aiohttp.ClientConnectionError:
+            print(f"✗ Error: Failed to connect to {self.api_config.name}. Please check your internet connection.")
+            return False
+        
+        except aiohttp.ClientResponseError as e:
+            print(f"✗ Error: HTTP error occurred for {self.api_config.name}: {e.message}")
+            print(f"  Status Code: {e.status}")
+            return False
+        
+        except aiohttp.ClientError as e:
+            print(f"✗ Error: An error occurred while fetching {self.api_config.name}: {e}")
+            return False
+        
+        except ValueError as e:
+            print(f"✗ Error: Failed to parse JSON response from {self.api_config.name}: {e}")
+            return False
+    
+    def fetch_data_sync(self) -> bool:
+        """
+        Fetch data from the selected API with a blocking GET on the shared session.
+        
+        Returns:
+            bool: True if data was fetched successfully, False otherwise
+        """
+        import requests
+        
+        try:
+            served, cached, headers = self._load_cached()
+            if served:
+                return True
+            
+            response = _get_session().get(self.api_config.url, headers=headers, timeout=_TIMEOUT)
+            
+            if response.status_code == 304 and headers:
+                self._use_cached(cached)
+                return True
             
             # Check if request was successful
             response.raise_for_status()
             
             # Parse JSON data
-            json_data = response.json()
+            json_data = _json_loads(response.content)
             
-            # Handle different response structures
-            if self.api_type == 'randomuser':
-                self.data = json_data.get('results', [])
-            else:
-                self.data = json_data
-            
-            print(f"✓ Successfully fetched {len(self.data)} records.\n")
+            self._accept(json_data, response.headers.get('ETag'))
             return True
             
-        except requests.exceptions.Timeout:
-            print("✗ Error: Request timed out. Please check your internet connection.")
+        except requests.exceptions.RequestException as e:
+            self._report_request_error(e)
             return False
         
-        except requests.exceptions.ConnectionError:
-            print("✗ Error: Failed to connect to the API. Please check your internet connection.")
+        except ValueError as e:
+            print(f"✗ Error: Failed to parse JSON response from {self.api_config.name}: {e}")
             return False
+    
+    def stream_and_display(self, limit: Optional[int] = None) -> bool:
+        """
+        Stream records from the API and display each one as soon as it is parsed.
         
-        except requests.exceptions.HTTPError as e:
-            print(f"✗ Error: HTTP error occurred: {e}")
-            print(f"  Status Code: {e.response.status_code}")
+        Unlike fetch_data, the response is never held as a whole list, which keeps
+        memory flat for large pages (e.g. CoinGecko with a high per_page). Nothing
+        is stored in self.data and the cache is bypassed. Requires ijson.
+        
+        Args:
+            limit (int, optional): Maximum number of records to display
+        
+        Returns:
+            bool: True if the stream was displayed successfully, False otherwise
+        """
+        import requests
+        import urllib3
+        
+        try:
+            import ijson
+        except ImportError:
+            print("✗ Error: Streaming requires the ijson package (pip install ijson).")
             return False
         
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Error: An error occurred while fetching data: {e}")
+        # Random User nests its records under "results"
+        prefix = 'results.item' if self.api_type == 'randomuser' else 'item'
+        
+        try:
+            print(f"Streaming data from {self.api_config.name}...")
+            print(f"URL: {self.api_config.url}\n")
+            
+            with _get_session().get(self.api_config.url, timeout=_TIMEOUT, stream=True) as response:
+                # Check if request was successful
+                response.raise_for_status()
+                
+                # Let urllib3 undo gzip/br before ijson reads the raw stream
+                response.raw.decode_content = True
+                records = ijson.items(response.raw, prefix, use_float=True)
+                if limit:
+                    records = islice(records, limit)
+                
+                displayed_count = 0
+                for idx, record in enumerate(records, start=1):
+                    sys.stdout.write(self._render(idx, record))
+                    displayed_count += 1
+            
+            if displayed_count == 0:
+                sys.stdout.write("No records were returned by the API.\n")
+            sys.stdout.flush()
+            return True
+            
+        # ijson reads response.raw directly, so mid-stream failures arrive unwrapped from urllib3
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            self._report_request_error(e)
             return False
         
-        except ValueError as e:
-            print(f"✗ Error: Failed to parse JSON response: {e}")
+        except ijson.JSONError as e:
+            print(f"✗ Error: Failed to parse JSON response from {self.api_config.name}: {e}")
             return False
     
-    def display_data(self, limit: Optional[int] = None, filter_func=None) -> None:
+    def _load_cached(self) -> Tuple[bool, object, Optional[Dict[str, str]]]:
+        """
+        Serve a fresh cache entry, or prepare to revalidate an expired one.
+        
+        Returns:
+            Tuple[bool, object, Optional[Dict[str, str]]]: Whether fresh cached data
+            was stored (no request needed), the expired cached data if any, and the
+            If-None-Match headers to send with the request
+        """
+        cached, etag, fresh = _cache_get(self.api_config.url, _CACHE_TTL)
+        if fresh:
+            print(f"Using cached data for {self.api_config.name}; no request made.\n")
+            self._store(cached)
+            return True, cached, None
+        
+        print(f"Fetching data from {self.api_config.name}...")
+        print(f"URL: {self.api_config.url}\n")
+        
+        # Revalidate an expired entry; a 304 reply carries no body
+        headers = {'If-None-Match': etag} if cached is not None and etag else None
+        return False, cached, headers
+    
+    def _use_cached(self, cached) -> None:
+        """Reuse cached data the server confirmed is unchanged (HTTP 304)."""
+        _cache_touch(self.api_config.url)
+        self._store(cached)
+    
+    def _accept(self, json_data, etag: Optional[str]) -> None:
+        """Store a freshly fetched payload, caching it only once _store accepted it."""
+        self._store(json_data)
+        _cache_put(self.api_config.url, json_data, etag)
+    
+    def _report_request_error(self, error: Exception) -> None:
+        """
+        Print the error message for a failed requests/urllib3 fetch.
+        
+        Args:
+            error (Exception): A requests RequestException or urllib3 HTTPError
+        """
+        import requests
+        import urllib3
+        
+        if isinstance(error, (requests.exceptions.Timeout, urllib3.exceptions.TimeoutError)):
+            print(f"✗ Error: Request to {self.api_config.name} timed out. Please check your internet connection.")
+        
+        elif isinstance(error, (requests.exceptions.ConnectionError, urllib3.exceptions.ProtocolError)):
+            print(f"✗ Error: Failed to connect to {self.api_config.name}. Please check your internet connection.")
+        
+        elif isinstance(error, requests.exceptions.HTTPError):
+            print(f"✗ Error: HTTP error occurred for {self.api_config.name}: {error}")
+            print(f"  Status Code: {error.response.status_code}")
+        
+        else:
+            print(f"✗ Error: An error occurred while fetching {self.api_config.name}: {error}")
+    
+    def _store(self, json_data) -> None:
+        """Store parsed JSON, handling the different response structures."""
+        if self.api_type == 'randomuser':
+            self.data = json_data.get('results', [])
+        else:
+            self.data = json_data
+        
+        print(f"✓ Successfully fetched {len(self.data)} records from {self.api_config.name}.\n")
+    
+    def display_data(self, limit: Optional[int] = None, filter_func=None,
+                     rendered: Optional[List[Optional[str]]] = None) -> None:
         """
         Display fetched data in a formatted manner.
         
         Args:
             limit (int, optional): Maximum number of records to display
             filter_func (callable, optional): Function to filter records
+            rendered (list, optional): Output of render_records() for the current data,
+                so several displays of the same records format them only once
         """
         if not self.data:
             print("No data available. Please fetch data first.")
             return
         
+        if rendered is not None and len(rendered) != len(self.data):
+            raise ValueError("rendered must hold one entry per record; call render_records() again")
+        
+        buf = []
         displayed_count = 0
         
-        for idx, record in enumerate(self.data, start=1):
+        for pos, record in enumerate(self.data):
             try:
                 # Apply filter if provided
                 if filter_func and not filter_func(record):
                     continue
                 
-                # Display based on API type
-                if self.api_type == 'jsonplaceholder':
-                    self._display_user(idx, record)
-                elif self.api_type == 'randomuser':
-                    self._display_random_user(idx, record)
-                elif self.api_type == 'coingecko':
-                    self._display_crypto(idx, record)
-                
-                displayed_count += 1
-                
-                # Check limit
-                if limit and displayed_count >= limit:
-                    break
-                
+                text = rendered[pos] if rendered is not None else None
+                if text is None:
+                    text = self._display(pos + 1, record)
+            
             except Exception as e:
-                print(f"⚠ Warning: Error processing record {idx}: {e}")
-                print("-" * 50)
+                # A record the filter or formatter chokes on is reported, not shown
+                buf.append(self._warning(pos + 1, e))
                 continue
+            
+            buf.append(text)
+            displayed_count += 1
+            
+            # Only successfully shown records count, so this check (not a slice of
+            # self.data) is what bounds the scan; later records are never touched
+            if limit and displayed_count >= limit:
+                break
         
         if displayed_count == 0:
-            print("No records matched the filter criteria.")
+            buf.append("No records matched the filter criteria.\n")
+        
+        # One write for the whole batch instead of one print per field
+        _write_stdout(''.join(buf), len(buf))
     
-    def _display_user(self, idx: int, user: Dict) -> None:
-        """Display JSONPlaceholder user data."""
-        name = user.get('name', 'N/A')
-        username = user.get('username', 'N/A')
-        email = user.get('email', 'N/A')
-        city = user.get('address', {}).get('city', 'N/A')
+    def render_records(self) -> List[Optional[str]]:
+        """
+        Format every fetched record once, for reuse across display_data calls.
         
-        print(f"User {idx}:")
-        print(f"Name: {name}")
-        print(f"Username: {username}")
-        print(f"Email: {email}")
-        print(f"City: {city}")
-        print("-" * 24)
+        The result is a snapshot: build it again after changing self.data.
+        
+        Returns:
+            List[Optional[str]]: Formatted text per record; None where formatting
+            failed, so display_data reports the warning for that record itself
+        """
+        rendered = []
+        for idx, record in enumerate(self.data or [], start=1):
+            try:
+                rendered.append(self._display(idx, record))
+            except Exception:
+                rendered.append(None)
+        return rendered
+    
+    def _render(self, idx: int, record: Dict) -> str:
+        """Format one record, turning a malformed record into a warning."""
+        try:
+            return self._display(idx, record)
+        except Exception as e:
+            return self._warning(idx, e)
     
-    def _display_random_user(self, idx: int, user: Dict) -> None:
-        """Display Random User API data."""
+    @staticmethod
+    def _warning(idx: int, error: Exception) -> str:
+        """Format the warning shown in place of a record that could not be processed."""
+        return f"⚠ Warning: Error processing record {idx}: {error}\n{'-' * 50}\n"
+    
+    def _display_user(self, idx: int, user: Dict) -> str:
+        """Format JSONPlaceholder user data."""
+        try:
+            name, username, email = _USER_FIELDS(user)
+        except KeyError:
+            # Incomplete record: fill the gaps one field at a time
+            name = user.get('name', 'N/A')
+            username = user.get('username', 'N/A')
+            email = user.get('email', 'N/A')
+        city = (user.get('address') or _EMPTY).get('city', 'N/A')
+        
+        return (
+            f"User {idx}:\n"
+            f"Name: {name}\n"
+            f"Username: {username}\n"
+            f"Email: {email}\n"
+            f"City: {city}\n"
+            f"{'-' * 24}\n"
+        )
+    
+    def _display_random_user(self, idx: int, user: Dict) -> str:
+        """Format Random User API data."""
         name_obj = user.get('name', {})
         name = f"{name_obj.get('first', '')} {name_obj.get('last', '')}".strip() or 'N/A'
         email = user.get('email', 'N/A')
         city = user.get('location', {}).get('city', 'N/A')
         country = user.get('location', {}).get('country', 'N/A')
         
-        print(f"User {idx}:")
-        print(f"Name: {name}")
-        print(f"Email: {email}")
-        print(f"City: {city}")
-        print(f"Country: {country}")
-        print("-" * 24)
+        return (
+            f"User {idx}:\n"
+            f"Name: {name}\n"
+            f"Email: {email}\n"
+            f"City: {city}\n"
+            f"Country: {country}\n"
+            f"{'-' * 24}\n"
+        )
     
-    def _display_crypto(self, idx: int, crypto: Dict) -> None:
-        """Display CoinGecko cryptocurrency data."""
+    def _display_crypto(self, idx: int, crypto: Dict) -> str:
+        """Format CoinGecko cryptocurrency data."""
         name = crypto.get('name', 'N/A')
         symbol = crypto.get('symbol', 'N/A').upper()
         price = crypto.get('current_price', 0)
         market_cap = crypto.get('market_cap', 0)
         
-        print(f"Crypto {idx}:")
-        print(f"Name: {name}")
-        print(f"Symbol: {symbol}")
-        print(f"Current Price: ${price:,.2f}" if isinstance(price, (int, float)) else f"Price: {price}")
-        print(f"Market Cap: ${market_cap:,.0f}" if isinstance(market_cap, (int, float)) else f"Market Cap: {market_cap}")
-        print("-" * 24)
+        price_line = f"Current Price: ${price:,.2f}" if isinstance(price, (int, float)) else f"Price: {price}"
+        market_cap_line = f"Market Cap: ${market_cap:,.0f}" if isinstance(market_cap, (int, float)) else f"Market Cap: {market_cap}"
+        
+        return (
+            f"Crypto {idx}:\n"
+            f"Name: {name}\n"
+            f"Symbol: {symbol}\n"
+            f"{price_line}\n"
+            f"{market_cap_line}\n"
+            f"{'-' * 24}\n"
+        )
     
     def get_count(self) -> int:
         """Get the total number of records fetched."""
         return len(self.data) if self.data else 0
 
 
+def _report_unexpected_error(fetcher: PublicAPIFetcher, error: BaseException) -> None:
+    """Print an error that escaped a fetcher, in the same style as the handled ones."""
+    print(f"✗ Error: Unexpected failure while fetching {fetcher.api_config.name}: "
+          f"{type(error).__name__}: {error}")
+
+
+async def fetch_all(api_types: Iterable[str]) -> List[Tuple[PublicAPIFetcher, bool]]:
+    """
+    Fetch several APIs concurrently over one shared session.
+    
+    Args:
+        api_types (Iterable[str]): API types to fetch
+    
+    Returns:
+        List[Tuple[PublicAPIFetcher, bool]]: Each fetcher paired with its fetch result
+    """
+    import aiohttp
+    
+    fetchers = [PublicAPIFetcher(api_type) for api_type in api_types]
+    
+    # One connector for every fetcher: pooled sockets, cached DNS and kept-alive TLS.
+    # HTTP/2 would not help here: each API lives on its own host, so there is
+    # nothing to multiplex onto a shared connection.
+    connector = aiohttp.TCPConnector(
+        limit=10,
+        limit_per_host=4,
+        ttl_dns_cache=300,
+        keepalive_timeout=30
+    )
+    
+    async with aiohttp.ClientSession(connector=connector, headers=_HEADERS) as session:
+        results = await asyncio.gather(
+            *(fetcher.fetch_data(session) for fetcher in fetchers),
+            return_exceptions=True
+        )
+    
+    fetched = []
+    for fetcher, result in zip(fetchers, results):
+        # Anything not caught inside fetch_data counts as a failed fetch
+        if isinstance(result, BaseException):
+            _report_unexpected_error(fetcher, result)
+        fetched.append((fetcher, result is True))
+    
+    return fetched
+
+
+def fetch_all_threaded(api_types: Iterable[str]) -> List[Tuple[PublicAPIFetcher, bool]]:
+    """
+    Fetch several APIs concurrently on a thread pool, for when aiohttp is unavailable.
+    
+    Args:
+        api_types (Iterable[str]): API types to fetch
+    
+    Returns:
+        List[Tuple[PublicAPIFetcher, bool]]: Each fetcher paired with its fetch result
+    """
+    fetchers = [PublicAPIFetcher(api_type) for api_type in api_types]
+    
+    fetched = []
+    with ThreadPoolExecutor(max_workers=len(fetchers) or 1) as executor:
+        futures = [executor.submit(fetcher.fetch_data_sync) for fetcher in fetchers]
+        
+        for fetcher, future in zip(fetchers, futures):
+            # Anything not caught inside fetch_data_sync counts as a failed fetch
+            try:
+                fetched.append((fetcher, future.result()))
+            except Exception as e:
+                _report_unexpected_error(fetcher, e)
+                fetched.append((fetcher, False))
+    
+    return fetched
+
+
+# Above this many records the batch skips TextIOWrapper and goes straight to the fd
+_RAW_WRITE_THRESHOLD = 50
+
+
+def _write_stdout(text: str, record_count: int) -> None:
+    """
+    Write a formatted batch to stdout in one call.
+    
+    Large batches are encoded once and handed to os.write, bypassing the text
+    layer; small ones, or platforms that translate newlines, use sys.stdout.
+    
+    Args:
+        text (str): Formatted output
+        record_count (int): Number of records in the batch
+    """
+    if record_count >= _RAW_WRITE_THRESHOLD and os.linesep == '\n':
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        
+        if fd is not None:
+            # Earlier print() output must reach the fd first
+            sys.stdout.flush()
+            data = memoryview(text.encode(sys.stdout.encoding or 'utf-8', sys.stdout.errors or 'strict'))
+            while data:
+                data = data[os.write(fd, data):]
+            return
+    
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def city_filter(user: Dict) -> bool:
+    """Keep users whose city starts with 'S'."""
+    city = (user.get('address') or _EMPTY).get('city') or ''
+    return city[:1] == 'S'
+
+
 def main():
     """Main function to execute the API data fetching."""
     
@@ -187,38 +707,70 @@ def main():
     print("1. JSONPlaceholder Users API (Default)")
     print("2. Random User Generator API")
     print("3. CoinGecko Cryptocurrency API")
-    print("=" * 70)
+    print("=" * 70 + "\n")
+    
+    # Fetch all three APIs at once; total wait is the slowest endpoint
+    api_types = ('jsonplaceholder', 'randomuser', 'coingecko')
+    if _HAS_AIOHTTP:
+        results = asyncio.run(fetch_all(api_types))
+    else:
+        results = fetch_all_threaded(api_types)
+    (users, users_ok), (random_users, random_users_ok), (cryptos, cryptos_ok) = results
     
     # ============================================
     # OPTION 1: JSONPlaceholder Users (Default)
     # ============================================
-    print("\n\n" + "=" * 70)
+    print("\n" + "=" * 70)
     print("OPTION 1: JSONPLACEHOLDER USERS API")
     print("=" * 70)
     
-    fetcher = PublicAPIFetcher('jsonplaceholder')
-    
-    if fetcher.fetch_data():
+    if users_ok:
+        # Format once; the filtered listing below reuses the same text
+        rendered = users.render_records()
+        
         # Display all users
         print("DISPLAYING ALL USERS:")
         print("-" * 70)
-        fetcher.display_data()
+        users.display_data(rendered=rendered)
         
         # Bonus: Filter users whose city starts with 'S'
         print("\n" + "=" * 70)
         print("BONUS: USERS FROM CITIES STARTING WITH 'S'")
         print("=" * 70)
         
-        def city_filter(user):
-            city = user.get('address', {}).get('city', '')
-            return city.startswith('S')
-        
-        fetcher.display_data(filter_func=city_filter)
+        users.display_data(filter_func=city_filter, rendered=rendered)
         
         # Summary
         print("\n" + "=" * 70)
-        print(f"Total records processed: {fetcher.get_count()}")
+        print(f"Total records processed: {users.get_count()}")
         print("=" * 70)
+    else:
+        print("✗ Fetch failed; nothing to display.")
+    
+    # ============================================
+    # OPTION 2: Random User Generator
+    # ============================================
+    print("\n\n" + "=" * 70)
+    print("OPTION 2: RANDOM USER GENERATOR API")
+    print("=" * 70)
     
+    if random_users_ok:
+        random_users.display_data(limit=5)
+    else:
+        print("✗ Fetch failed; nothing to display.")
+    
+    # ============================================
+    # OPTION 3: CoinGecko Cryptocurrency
+    # ============================================
+    print("\n\n" + "=" * 70)
+    print("OPTION 3: COINGECKO CRYPTOCURRENCY API")
+    print("=" * 70)
+    
+    if cryptos_ok:
+        cryptos.display_data(limit=5)
+    else:
+        print("✗ Fetch failed; nothing to display.")
+    
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()